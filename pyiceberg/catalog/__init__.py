@@ -24,6 +24,7 @@ import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Callable,
@@ -318,6 +319,11 @@ def _import_catalog(name: str, catalog_impl: str, properties: Properties) -> Opt
         return None
 
 
+@lru_cache(maxsize=4096)
+def _str_to_identifier(identifier: str) -> Identifier:
+    return tuple(identifier.split("."))
+
+
 @dataclass
 class PropertiesUpdateSummary:
     removed: List[str]
@@ -669,7 +675,9 @@ class Catalog(ABC):
         Returns:
             Identifier: a tuple of strings.
         """
-        return identifier if isinstance(identifier, tuple) else tuple(str.split(identifier, "."))
+        if isinstance(identifier, tuple):
+            return identifier
+        return _str_to_identifier(identifier)
 
     @staticmethod
     def table_name_from(identifier: Union[str, Identifier]) -> str:
@@ -901,22 +909,14 @@ class MetastoreCatalog(Catalog, ABC):
         self._check_for_overlap(updates=updates, removals=removals)
         updated_properties = dict(current_properties)
 
-        removed: Set[str] = set()
-        updated: Set[str] = set()
-
-        if removals:
-            for key in removals:
-                if key in updated_properties:
-                    updated_properties.pop(key)
-                    removed.add(key)
-        if updates:
-            for key, value in updates.items():
-                updated_properties[key] = value
-                updated.add(key)
+        removals = removals or set()
+        removed = removals & updated_properties.keys()
+        for key in removed:
+            del updated_properties[key]
+        updated_properties.update(updates)
 
-        expected_to_change = (removals or set()).difference(removed)
         properties_update_summary = PropertiesUpdateSummary(
-            removed=list(removed or []), updated=list(updated or []), missing=list(expected_to_change)
+            removed=list(removed), updated=list(updates.keys()), missing=list(removals - removed)
         )
 
         return properties_update_summary, updated_properties
@@ -28,6 +28,7 @@ from sqlalchemy import (
     String,
     create_engine,
     delete,
+    func,
     insert,
     select,
     union,
@@ -168,7 +169,9 @@ class SqlCatalog(MetastoreCatalog):
             identifier=Catalog.identifier_to_tuple(table_namespace) + (table_name,),
             metadata=metadata,
             metadata_location=metadata_location,
-            io=self._load_file_io(metadata.properties, metadata_location),
+            # The FileIO used to read the metadata is only configured with the catalog properties,
+            # so it can be reused as-is unless the table properties need to be merged in
+            io=self._load_file_io(metadata.properties, metadata_location) if metadata.properties else io,
             catalog=self,
         )
 
@@ -421,13 +424,24 @@ class SqlCatalog(MetastoreCatalog):
         namespace = Catalog.namespace_to_string(namespace_tuple)
         table_name = Catalog.table_name_from(table_identifier)
 
+        with Session(self.engine) as session:
+            stmt = select(IcebergTables).where(
+                IcebergTables.catalog_name == self.name,
+                IcebergTables.table_namespace == namespace,
+                IcebergTables.table_name == table_name,
+            )
+            orm_table = session.scalar(stmt)
+
         current_table: Optional[Table]
-        try:
-            current_table = self.load_table(table_identifier)
-        except NoSuchTableError:
+        if orm_table is None:
             current_table = None
+        elif orm_table.metadata_location == table.metadata_location:
+            # Metadata files are immutable, so the table being committed already carries the current metadata
+            current_table = table
+        else:
+            current_table = self._convert_orm_to_iceberg(orm_table)
 
-        updated_staged_table = self._update_and_stage_table(current_table, table.name(), requirements, updates)
+        updated_staged_table = self._update_and_stage_table(current_table, table_identifier, requirements, updates)
         if current_table and updated_staged_table.metadata == current_table.metadata:
             # no changes, do nothing
             return CommitTableResponse(metadata=current_table.metadata, metadata_location=current_table.metadata_location)
@@ -569,10 +583,16 @@ class SqlCatalog(MetastoreCatalog):
             raise NoSuchNamespaceError(f"Namespace does not exist: {namespace}")
 
         namespace_str = Catalog.namespace_to_string(namespace)
-        if tables := self.list_tables(namespace):
-            raise NamespaceNotEmptyError(f"Namespace {namespace_str} is not empty. {len(tables)} tables exist.")
-
         with Session(self.engine) as session:
+            # Count in the database rather than materializing the table identifiers just to check for emptiness
+            stmt = (
+                select(func.count())
+                .select_from(IcebergTables)
+                .where(IcebergTables.catalog_name == self.name, IcebergTables.table_namespace == namespace_str)
+            )
+            if table_count := session.scalar(stmt):
+                raise NamespaceNotEmptyError(f"Namespace {namespace_str} is not empty. {table_count} tables exist.")
+
             session.execute(
                 delete(IcebergNamespaceProperties).where(
                     IcebergNamespaceProperties.catalog_name == self.name,
@@ -596,11 +616,15 @@ class SqlCatalog(MetastoreCatalog):
         if namespace and not self._namespace_exists(namespace):
             raise NoSuchNamespaceError(f"Namespace does not exist: {namespace}")
 
-        namespace = Catalog.namespace_to_string(namespace)
-        stmt = select(IcebergTables).where(IcebergTables.catalog_name == self.name, IcebergTables.table_namespace == namespace)
+        namespace_str = Catalog.namespace_to_string(namespace)
+        # All rows share the same namespace, so only fetch the table names and build the identifiers from a single tuple
+        namespace_tuple = Catalog.identifier_to_tuple(namespace_str)
+        stmt = select(IcebergTables.table_name).where(
+            IcebergTables.catalog_name == self.name, IcebergTables.table_namespace == namespace_str
+        )
         with Session(self.engine) as session:
             result = session.scalars(stmt)
-            return [(Catalog.identifier_to_tuple(table.table_namespace) + (table.table_name,)) for table in result]
+            return [namespace_tuple + (table_name,) for table_name in result]
 
     def list_namespaces(self, namespace: Union[str, Identifier] = ()) -> List[Identifier]:
         """List namespaces from the given namespace. If not given, list top-level namespaces from the catalog.
@@ -690,24 +714,19 @@ class SqlCatalog(MetastoreCatalog):
         )[0]
 
         with Session(self.engine) as session:
-            if removals:
+            # SQLAlchemy does not (yet) support engine agnostic UPSERT
+            # https://docs.sqlalchemy.org/en/20/orm/queryguide/dml.html#orm-upsert-statements
+            # This is not a problem since it runs in a single transaction.
+            # Removed and updated keys are disjoint, so a single delete clears both before inserting the updates.
+            if keys_to_delete := (removals or set()) | updates.keys():
                 delete_stmt = delete(IcebergNamespaceProperties).where(
                     IcebergNamespaceProperties.catalog_name == self.name,
                     IcebergNamespaceProperties.namespace == namespace_str,
-                    IcebergNamespaceProperties.property_key.in_(removals),
+                    IcebergNamespaceProperties.property_key.in_(keys_to_delete),
                 )
                 session.execute(delete_stmt)
 
             if updates:
-                # SQLAlchemy does not (yet) support engine agnostic UPSERT
-                # https://docs.sqlalchemy.org/en/20/orm/queryguide/dml.html#orm-upsert-statements
-                # This is not a problem since it runs in a single transaction
-                delete_stmt = delete(IcebergNamespaceProperties).where(
-                    IcebergNamespaceProperties.catalog_name == self.name,
-                    IcebergNamespaceProperties.namespace == namespace_str,
-                    IcebergNamespaceProperties.property_key.in_(set(updates.keys())),
-                )
-                session.execute(delete_stmt)
                 insert_stmt_values = [
                     {
                         IcebergNamespaceProperties.catalog_name: self.name,
@@ -66,6 +66,9 @@ TEST_TABLE_SCHEMA = Schema(
 )
 TEST_TABLE_PARTITION_SPEC = PartitionSpec(PartitionField(name="x", transform=IdentityTransform(), source_id=1, field_id=1000))
 TEST_TABLE_PROPERTIES = {"key1": "value1", "key2": "value2"}
+NEW_TABLE_NAME = "new.namespace.new_table"
+NEW_TABLE_IDENTIFIER = ("new", "namespace", "new_table")
+NEW_TABLE_NAMESPACE = ("new", "namespace")
 NO_SUCH_TABLE_ERROR = "Table does not exist: com.organization.department.my_table"
 TABLE_ALREADY_EXISTS_ERROR = "Table com.organization.department.my_table already exists"
 NAMESPACE_ALREADY_EXISTS_ERROR = "Namespace \\('com', 'organization', 'department'\\) already exists"
@@ -134,6 +137,17 @@ def test_namespace_from_str() -> None:
     assert namespace_from == ("com", "organization", "department")
 
 
+def test_identifier_to_tuple_from_str_is_cached() -> None:
+    # Given
+    identifier = "com.organization.department.my_table"
+    # When
+    first = Catalog.identifier_to_tuple(identifier)
+    second = Catalog.identifier_to_tuple("com.organization.department.my_table")
+    # Then
+    assert first == ("com", "organization", "department", "my_table")
+    assert first is second
+
+
 def test_name_from_tuple() -> None:
     # Given
     identifier = ("com", "organization", "department", "my_table")
@@ -306,16 +320,15 @@ def test_rename_table(catalog: InMemoryCatalog) -> None:
     given_catalog_has_a_table(catalog)
 
     # When
-    new_table = "new.namespace.new_table"
-    catalog.create_namespace(("new", "namespace"))
-    table = catalog.rename_table(TEST_TABLE_IDENTIFIER, new_table)
+    catalog.create_namespace(NEW_TABLE_NAMESPACE)
+    table = catalog.rename_table(TEST_TABLE_IDENTIFIER, NEW_TABLE_NAME)
 
     # Then
-    assert table._identifier == Catalog.identifier_to_tuple(new_table)
+    assert table._identifier == NEW_TABLE_IDENTIFIER
 
     # And
-    table = catalog.load_table(new_table)
-    assert table._identifier == Catalog.identifier_to_tuple(new_table)
+    table = catalog.load_table(NEW_TABLE_NAME)
+    assert table._identifier == NEW_TABLE_IDENTIFIER
 
     # And
     assert catalog._namespace_exists(table._identifier[:-1])
@@ -330,16 +343,15 @@ def test_rename_table_from_self_identifier(catalog: InMemoryCatalog) -> None:
     table = given_catalog_has_a_table(catalog)
 
     # When
-    new_table_name = "new.namespace.new_table"
-    catalog.create_namespace(("new", "namespace"))
-    new_table = catalog.rename_table(table._identifier, new_table_name)
+    catalog.create_namespace(NEW_TABLE_NAMESPACE)
+    new_table = catalog.rename_table(table._identifier, NEW_TABLE_NAME)
 
     # Then
-    assert new_table._identifier == Catalog.identifier_to_tuple(new_table_name)
+    assert new_table._identifier == NEW_TABLE_IDENTIFIER
 
     # And
     new_table = catalog.load_table(new_table._identifier)
-    assert new_table._identifier == Catalog.identifier_to_tuple(new_table_name)
+    assert new_table._identifier == NEW_TABLE_IDENTIFIER
 
     # And
     assert catalog._namespace_exists(new_table._identifier[:-1])